@@ -11,59 +11,128 @@ Compatible with the new database:
 
 from __future__ import annotations
 
+import importlib.util
+import os
+import re
+import string
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml emitter, much faster
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
 
 # ---------------------------
 # CONFIG (paths are script-relative)
 # ---------------------------
 BASE_DIR = Path(__file__).resolve().parent  # .../docs
 EXCEL_PATH = BASE_DIR / "iNUXHandbook.xlsx"
+SHEET_CACHE_PATH = BASE_DIR / "iNUXHandbook.parquet"  # columnar copy of the sheet, rebuilt when the xlsx changes
 OUTPUT_DIR = BASE_DIR / "generated"        # i.e., docs/generated/
 
 WELCOME_PAGE_ID = "00000000_en"
 
+# The only spreadsheet columns this script reads (page_id and title are required)
+SHEET_COLUMNS = frozenset(
+    {"page_id", "title", "layout", "lang_code", "parent_id", "has_children", "display_order"}
+)
+
+# Page generation is mostly small-file I/O, so use more threads than cores
+MAX_WORKERS = (os.cpu_count() or 1) * 2
+
+# Rust-backed reader (pip install python-calamine); falls back to openpyxl if absent
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
+# Parquet cache needs pyarrow (or fastparquet); without either we always read the xlsx
+HAS_PARQUET = any(importlib.util.find_spec(m) for m in ("pyarrow", "fastparquet"))
+
 # ---------------------------
 # Helpers
 # ---------------------------
 
-def is_missing(value: Any) -> bool:
-    """True for None, NaN, '', 'nan', 'NaN', etc."""
-    if value is None:
-        return True
+def read_sheet(path: Path) -> pd.DataFrame:
+    """Read the spreadsheet with every cell as a string ('' for blanks)."""
+    # Callable usecols skips unused columns without failing when an optional one is absent
+    def wanted(col: str) -> bool:
+        return col in SHEET_COLUMNS
+
     try:
-        if pd.isna(value):
-            return True
-    except Exception:
-        pass
-    s = str(value).strip()
-    return s == "" or s.lower() == "nan"
+        df = pd.read_excel(path, dtype=str, engine=EXCEL_ENGINE, usecols=wanted)
+    except ValueError:
+        if EXCEL_ENGINE == "openpyxl":
+            raise
+        # pandas < 2.2 has no calamine engine even with python-calamine installed
+        df = pd.read_excel(path, dtype=str, engine="openpyxl", usecols=wanted)
+    # calamine also returns formatted-but-empty rows that openpyxl trims
+    return df.dropna(how="all").fillna("")
 
 
-def clean_str(value: Any, default: str = "") -> str:
-    return default if is_missing(value) else str(value).strip()
+def load_sheet(path: Path, cache_path: Path = SHEET_CACHE_PATH) -> pd.DataFrame:
+    """
+    Like read_sheet, but goes through a Parquet copy of the sheet.
+    The cache is used only if it is at least as new as the xlsx and this script
+    (which decides what gets cached, e.g. SHEET_COLUMNS); otherwise the xlsx
+    is read and the cache rewritten.
+    """
+    if HAS_PARQUET and cache_path.exists() and cache_path.stat().st_mtime >= max(
+        path.stat().st_mtime, Path(__file__).stat().st_mtime
+    ):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"⚠ Ignoring unreadable sheet cache {cache_path}: {e}")
 
+    df = read_sheet(path)
+    if HAS_PARQUET:
+        try:
+            df.to_parquet(cache_path, index=False)
+        except Exception as e:
+            print(f"⚠ Could not write sheet cache {cache_path}: {e}")
+    return df
 
-def as_bool(value: Any) -> bool:
-    """Robust bool parsing for spreadsheet values."""
-    if isinstance(value, bool):
-        return value
-    if is_missing(value):
-        return False
-    return str(value).strip().lower() in {"true", "1", "yes", "y", "on"}
 
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean a string-typed sheet in one pass: strip every cell and blank out 'nan'."""
+    df = df.apply(lambda col: col.str.strip())
+    return df.mask(df.apply(lambda col: col.str.lower()) == "nan", "")
 
-def as_int(value: Any, default: int = 0) -> int:
-    if is_missing(value):
-        return default
-    try:
-        return int(float(str(value).strip()))
-    except Exception:
-        return default
+
+def column_array(df: pd.DataFrame, col: str, default: Any = "") -> np.ndarray:
+    """Column values as a NumPy object array; filled with `default` if the column is absent."""
+    if col in df.columns:
+        return df[col].to_numpy(dtype=object)
+    return np.full(len(df), default, dtype=object)
+
+
+TRUE_STRINGS = {"true", "1", "yes", "y", "on"}
+
+
+def bool_list(df: pd.DataFrame, col: str) -> List[bool]:
+    """Robust bool parsing for a whole spreadsheet column; absent column -> all False."""
+    if col not in df.columns:
+        return [False] * len(df)
+    # Python bools (not numpy.bool_) so they dump as plain YAML
+    return df[col].str.lower().isin(TRUE_STRINGS).tolist()
+
+
+def nav_order_list(df: pd.DataFrame) -> List[int]:
+    """display_order as ints for every row; blank, unparseable or <= 0 become 1."""
+    if "display_order" in df.columns:
+        orders = pd.to_numeric(df["display_order"], errors="coerce")
+    else:
+        orders = pd.Series(0.0, index=df.index)
+    # NaN/inf -> 0, then truncate like int(float(...))
+    orders = orders.where(np.isfinite(orders), 0).astype("int64")
+    # Non-positive -> 1 as a deterministic fallback; Python ints so they dump as plain YAML
+    return orders.clip(lower=1).tolist()
 
 
 def normalize_nav_title(title: Optional[str]) -> Optional[str]:
@@ -80,46 +149,153 @@ def normalize_nav_title(title: Optional[str]) -> Optional[str]:
     return t
 
 
+# Strings PyYAML would emit as-is: printable ASCII, starts with a letter/digit,
+# no trailing space, and none of the characters that force quoting.
+PLAIN_YAML_STR_RE = re.compile(r"[A-Za-z0-9](?:[ -~]*[!-~])?")
+YAML_SPECIAL_CHARS = ":#\n\"'"
+YAML_LINE_WIDTH = 80  # PyYAML folds longer plain scalars
+YAML_RESOLVER = yaml.resolver.Resolver()
+
+
+def is_plain_yaml_str(key: str, value: str) -> bool:
+    """True if `key: value` would be dumped verbatim (no quoting, escaping or folding)."""
+    return (
+        PLAIN_YAML_STR_RE.fullmatch(value) is not None
+        and not any(c in value for c in YAML_SPECIAL_CHARS)
+        and len(key) + 2 + len(value) <= YAML_LINE_WIDTH
+        # e.g. "yes", "null", "01" resolve to non-strings and get quoted
+        and YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == "tag:yaml.org,2002:str"
+    )
+
+
 def safe_frontmatter_dump(frontmatter: Dict[str, Any]) -> str:
     """Dump YAML safely with unicode and without reordering keys."""
-    return "---\n" + yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=True) + "---\n\n"
+    dumped = yaml.dump(frontmatter, Dumper=YamlDumper, sort_keys=False, allow_unicode=True)
+    return "---\n" + dumped + "---\n\n"
 
 
-import re
+def whitespace_line_end(text: str, start: int) -> int:
+    """Index just past the last newline in the whitespace run at `start`, or -1 if the run has none."""
+    end = start
+    n = len(text)
+    while end < n and text[end].isspace():
+        end += 1
+    nl = text.rfind("\n", start, end)
+    return nl + 1 if nl >= 0 else -1
+
+
+def find_frontmatter_end(md_text: str, start: int) -> int:
+    """End of the first "\n---<blank>\n" closing line at or after `start`, or -1."""
+    pos = md_text.find("\n---", start)
+    while pos >= 0:
+        end = whitespace_line_end(md_text, pos + 4)
+        if end >= 0:
+            return end
+        pos = md_text.find("\n---", pos + 1)
+    return -1
 
-FRONTMATTER_RE = re.compile(r"\A---\s*\n.*?\n---\s*\n", re.DOTALL)
 
 def split_frontmatter(md_text: str) -> tuple[str, str]:
     """
     Returns (frontmatter_block_or_empty, rest_of_file).
     If no front matter is found, frontmatter_block is "" and rest is original text.
+    Plain string scanning: a file without front matter is rejected on its first line.
     """
-    m = FRONTMATTER_RE.match(md_text)
-    if not m:
+    if not md_text.startswith("---"):
+        return "", md_text
+    body_start = whitespace_line_end(md_text, 3)
+    if body_start < 0:
+        return "", md_text
+
+    end = find_frontmatter_end(md_text, body_start)
+    if end < 0:
+        # Blank lines right after the opening "---" may hold the closing line themselves
+        end = find_frontmatter_end(md_text, md_text.index("\n", 3) + 1)
+    if end < 0:
         return "", md_text
-    return m.group(0), md_text[m.end():]
+    return md_text[:end], md_text[end:]
+
+# O_BINARY keeps Windows from translating newlines in the raw write
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_utf8(path: Path, text: str, exclusive: bool = False) -> None:
+    """
+    Write `text` as UTF-8 with one encode and a raw fd write (no TextIOWrapper/buffering).
+    With `exclusive`, raise FileExistsError instead of truncating an existing file.
+    """
+    data = text.encode("utf-8")
+    flags = (WRITE_FLAGS | os.O_EXCL) & ~os.O_TRUNC if exclusive else WRITE_FLAGS
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
-def upsert_markdown_file(path, new_frontmatter_block: str, new_body_stub: str) -> bool:
+def read_page(path: Path) -> bytes:
+    """Whole file as bytes via one raw fd read loop."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def upsert_markdown_file(
+    path,
+    new_frontmatter_block: str,
+    new_body_stub: str,
+    exists: Optional[bool] = None,
+) -> bool:
     """
     Writes/updates markdown at `path`.
     - If file exists: replaces front matter only, preserves rest,
       AND ensures the EU funding block exists at the end.
     - If file doesn't exist: writes front matter + stub body + EU block.
-    Returns True if file was written/updated.
+    `exists` lets the caller pass a known answer instead of stat-ing `path`.
+    Returns True if file was written/updated, False if it was already current.
     """
-    if path.exists():
-        old = path.read_text(encoding="utf-8")
+    if exists is None:
+        exists = path.exists()
+    if not exists:
+        body = ensure_eu_block_at_end(new_body_stub)
+        try:
+            # O_EXCL: never truncate a page the caller did not know about
+            # (e.g. a differently-cased name on a case-insensitive filesystem)
+            write_utf8(path, new_frontmatter_block + body, exclusive=True)
+            return True
+        except FileExistsError:
+            pass
+
+    data = read_page(path)
+    on_disk = data.decode("utf-8")
+    # Same newline handling as read_text(); CR/CRLF pages are always rewritten as LF
+    old = on_disk.replace("\r\n", "\n").replace("\r", "\n") if "\r" in on_disk else on_disk
+    if old is on_disk and old.startswith(new_frontmatter_block):
+        # Front matter is already what we would write; only the footer can be stale
+        rest = old[len(new_frontmatter_block):]
+        if has_current_eu_block(rest):
+            return False
+    else:
         _, rest = split_frontmatter(old)
 
-        # Preserve body, but ensure EU block exists at the end
-        rest = ensure_eu_block_at_end(rest)
+    # Preserve body, but ensure EU block exists at the end
+    rest = ensure_eu_block_at_end(rest)
 
-        path.write_text(new_frontmatter_block + rest, encoding="utf-8")
-        return True
-    else:
-        body = ensure_eu_block_at_end(new_body_stub)
-        path.write_text(new_frontmatter_block + body, encoding="utf-8")
-        return True
+    new_content = new_frontmatter_block + rest
+    if new_content == on_disk:
+        # Leave mtime alone so Jekyll's incremental build skips the page
+        return False
+    write_utf8(path, new_content)
+    return True
 
 
 
@@ -127,8 +303,6 @@ def upsert_markdown_file(path, new_frontmatter_block: str, new_body_stub: str) -
 # EU co-funding block (footer-style, auto-replaces old versions)
 # ---------------------------
 
-import re
-
 EU_BLOCK_MARKER = "<!-- EU_FUNDING_FOOTER -->"
 
 EU_FUNDING_BLOCK = r"""
@@ -156,30 +330,63 @@ EU_FUNDING_BLOCK = r"""
 </div>
 """.strip() + "\n"
 
+# Separator + footer, appended to every page body
+EU_SUFFIX = "\n\n" + EU_FUNDING_BLOCK
 
 
-# Remove old/new EU blocks (anywhere), then append the new one at the end.
-EU_BLOCK_REMOVE_RE = re.compile(
-    r"""
-    # Remove EU footer variants only if they sit at the very end of the file
-    (?:\n{0,2}(?:---\s*\n{0,2})?)?                 # optional markdown hr before
-    (?:\s*<hr\b[^>]*>\s*)?                        # optional html hr before
-    \s*
-    (?:<!--\s*EU_FUNDING_FOOTER\s*-->.*?)(?=\Z)    # marker-based footer (any content) at end
-    |
-    (?:\n{0,2}(?:---\s*\n{0,2})?)?
-    (?:\s*<hr\b[^>]*>\s*)?
-    \s*
-    <table\b.*?eu-funded\.jpg.*?</table>\s*(?=\Z)  # old table version at end
-    |
-    (?:\n{0,2}(?:---\s*\n{0,2})?)?
-    (?:\s*<hr\b[^>]*>\s*)?
-    \s*
-    <div\b.*?eu-funded\.jpg.*?</div>\s*(?=\Z)      # older div version at end
-    """,
-    flags=re.IGNORECASE | re.DOTALL | re.VERBOSE,
-)
+LEGACY_EU_IMAGE = "eu-funded.jpg"  # marker-less table/div versions only had the image to go by
 
+# Footer markers are matched case-insensitively and with any inner spacing (searched on lowered text)
+EU_MARKER_LOWER_RE = re.compile(r"<!--\s*eu_funding_footer\s*-->")
+
+# Length-preserving lowercase, so indexes into the lowered text are valid in the original
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def find_eu_block_start(low: str) -> int:
+    """
+    Index where the trailing EU block starts in `low` (an rstripped body, ASCII-lowercased), or -1.
+    - Marker-based footer: from the first marker to the end of the file.
+    - Older markerless versions: the <table>/<div> holding the EU image,
+      but only if that element closes at the very end of the file.
+    Plain string scans, so large bodies cost one pass each.
+    """
+    m = EU_MARKER_LOWER_RE.search(low)
+    if m:
+        return m.start()
+
+    img = low.rfind(LEGACY_EU_IMAGE)
+    if img < 0:
+        return -1
+    if low.endswith("</table>"):
+        return low.rfind("<table", 0, img)
+    if low.endswith("</div>"):
+        # Walk out to the <div> that is closed by the final </div>
+        tail = low[img:]
+        start = img
+        for _ in range(tail.count("</div>") - tail.count("<div")):
+            start = low.rfind("<div", 0, start)
+            if start < 0:
+                return -1
+        return start if start < img else -1
+    return -1
+
+
+def strip_eu_block(body: str) -> str:
+    """Remove a trailing EU block (any version) plus the <hr>/--- separator right before it."""
+    low = body.translate(ASCII_LOWER)
+    start = find_eu_block_start(low)
+    if start < 0:
+        return body
+
+    head = body[:start].rstrip()
+    if head.endswith(">"):
+        hr = low.rfind("<hr", 0, len(head))
+        if hr >= 0 and head[hr + 3] in " \t\n/>" and ">" not in head[hr:-1]:
+            head = head[:hr].rstrip()
+    if head.endswith("---"):
+        head = head[:-3].rstrip()
+    return head
 
 
 def ensure_eu_block_at_end(md_body: str) -> str:
@@ -192,25 +399,58 @@ def ensure_eu_block_at_end(md_body: str) -> str:
     body = md_body.rstrip()
 
     # 1) Remove any EU block variants if they sit at the end
-    body = re.sub(EU_BLOCK_REMOVE_RE, "", body).rstrip()
+    body = strip_eu_block(body)
 
     # 2) Append the new one
-    body = body + "\n\n" + EU_FUNDING_BLOCK
+    body = body + EU_SUFFIX
     return body
 
 
+def has_current_eu_block(md_body: str) -> bool:
+    """True if ensure_eu_block_at_end(md_body) would return md_body unchanged."""
+    if not md_body.endswith(EU_SUFFIX):
+        return False
+    head_len = len(md_body) - len(EU_SUFFIX)
+    # Exactly one footer, with nothing strippable (whitespace, <hr>, ---) right before it
+    return md_body.find(EU_BLOCK_MARKER) == head_len + 2 and strip_eu_block(md_body) == md_body[:head_len]
+
+
 # ---------------------------
 # Markdown generation
 # ---------------------------
+NO_ANCESTORS: Tuple[str, str] = ("", "")
+
+
+def build_nav_ancestors(
+    title_by_page_id: Dict[str, str], parent_by_page_id: Dict[str, str]
+) -> Dict[str, Tuple[str, str]]:
+    """
+    For every page_id P: (nav title of P, nav title of P's parent), i.e. the
+    parent/grand_parent a child of P gets. Parent chains are fixed for the run,
+    so this is resolved once instead of per row.
+    """
+    ancestors: Dict[str, Tuple[str, str]] = {}
+    for pid, title in title_by_page_id.items():
+        if not pid:
+            continue
+        parent_title = normalize_nav_title(title)
+        gp_title = ""
+        if parent_title:
+            gp_id = parent_by_page_id.get(pid, "")
+            if gp_id:
+                gp_title = normalize_nav_title(title_by_page_id.get(gp_id, ""))
+        ancestors[pid] = (parent_title, gp_title)
+    return ancestors
+
+
 def build_frontmatter(
     *,
     title: str,
     layout: str,
     nav_order: int,
     has_children: bool,
-    parent_id: str,
-    title_by_page_id: Dict[str, str],
-    parent_by_page_id: Dict[str, str],
+    parent_title: str = "",
+    grand_parent_title: str = "",
 ) -> Dict[str, Any]:
     fm: Dict[str, Any] = {
         "title": title,
@@ -223,21 +463,59 @@ def build_frontmatter(
     if has_children:
         fm["has_toc"] = False
 
-    # Resolve parent/grand_parent titles from IDs
-    if parent_id:
-        parent_title = normalize_nav_title(title_by_page_id.get(parent_id, ""))
-        if parent_title:
-            fm["parent"] = parent_title
-
-            gp_id = clean_str(parent_by_page_id.get(parent_id, ""), "")
-            if gp_id:
-                gp_title = normalize_nav_title(title_by_page_id.get(gp_id, ""))
-                if gp_title:
-                    fm["grand_parent"] = gp_title
+    # parent/grand_parent titles are resolved from IDs up front (build_nav_ancestors)
+    if parent_title:
+        fm["parent"] = parent_title
+        if grand_parent_title:
+            fm["grand_parent"] = grand_parent_title
 
     return fm
 
 
+def render_frontmatter(
+    *,
+    title: str,
+    layout: str,
+    nav_order: int,
+    has_children: bool,
+    parent_title: str = "",
+    grand_parent_title: str = "",
+) -> str:
+    """
+    Same text as safe_frontmatter_dump(build_frontmatter(...)), but written
+    straight from the fields when every string is plain YAML (the usual case).
+    Anything unusual goes through the real emitter.
+    """
+    strings = [("title", title), ("layout", layout)]
+    if parent_title:
+        strings.append(("parent", parent_title))
+        if grand_parent_title:
+            strings.append(("grand_parent", grand_parent_title))
+    if not all(is_plain_yaml_str(key, value) for key, value in strings):
+        return safe_frontmatter_dump(
+            build_frontmatter(
+                title=title,
+                layout=layout,
+                nav_order=nav_order,
+                has_children=has_children,
+                parent_title=parent_title,
+                grand_parent_title=grand_parent_title,
+            )
+        )
+
+    block = (
+        f"---\ntitle: {title}\nlayout: {layout}\nnav_order: {nav_order}\n"
+        f"has_children: {'true' if has_children else 'false'}\n"
+    )
+    if has_children:
+        block += "has_toc: false\n"
+    if parent_title:
+        block += f"parent: {parent_title}\n"
+        if grand_parent_title:
+            block += f"grand_parent: {grand_parent_title}\n"
+    return block + "---\n\n"
+
+
 def build_body(*, page_id: str, parent_id: str, lang_code: str, title: str) -> str:
     meta = (
         f"<!-- page_id: {page_id} -->\n"
@@ -257,7 +535,9 @@ def main() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     # Read everything as string to avoid pandas turning blanks into NaN surprises.
-    df = pd.read_excel(EXCEL_PATH, dtype=str).fillna("")
+    df = load_sheet(EXCEL_PATH)
+    # Strip + missing-value handling for all cells at once, so empty string == missing below
+    df = clean_frame(df)
 
     # Required columns in your new sheet
     required_cols = {"page_id", "title"}
@@ -265,70 +545,88 @@ def main() -> None:
     if missing_cols:
         raise KeyError(f"Missing required columns in Excel: {sorted(missing_cols)}")
 
-    # Normalize key columns
-    df["page_id"] = df["page_id"].astype(str).str.strip()
-    df["title"] = df["title"].astype(str).str.strip()
+    # Pull the columns out once; indexing plain arrays is far cheaper than iterrows()
+    page_ids = column_array(df, "page_id")
+    titles = column_array(df, "title")
+    layouts = column_array(df, "layout")
+    lang_codes = column_array(df, "lang_code")
+    parent_ids = column_array(df, "parent_id")
+    has_children_flags = bool_list(df, "has_children")
+    # Use display_order as nav_order (your new sheet standard)
+    nav_orders = nav_order_list(df)
 
-    # Lookups
-    title_by_page_id: Dict[str, str] = dict(zip(df["page_id"], df["title"]))
+    # Lookups (cells are already stripped strings, so no per-column cleanup here)
+    page_id_list = page_ids.tolist()
+    title_by_page_id: Dict[str, str] = dict(zip(page_id_list, titles.tolist()))
 
     parent_by_page_id: Dict[str, str] = {}
     if "parent_id" in df.columns:
-        parent_by_page_id = dict(zip(df["page_id"], df["parent_id"].astype(str).str.strip()))
+        parent_by_page_id = dict(zip(page_id_list, parent_ids.tolist()))
+    nav_ancestors = build_nav_ancestors(title_by_page_id, parent_by_page_id)
+
+    # casefold: ids differing only in case share a file on case-insensitive filesystems
+    named_ids = [pid.casefold() for pid in page_id_list if pid]
+    unique_ids = len(set(named_ids)) == len(named_ids)
 
-    wrote = 0
-    skipped = 0
+    # One directory listing instead of a stat per page
+    try:
+        existing_files = {e.name for e in os.scandir(OUTPUT_DIR) if e.is_file()}
+    except FileNotFoundError:
+        existing_files = set()
 
-    for _, row in df.iterrows():
-        page_id = clean_str(row.get("page_id"), "")
+    def process_row(i: int) -> Optional[str]:
+        """Generate/update one page; returns "wrote", "unchanged", "skipped" or None (no page_id)."""
+        page_id = page_ids[i]
         if not page_id:
-            continue
+            return None
 
         # Skip welcome/root
         if page_id == WELCOME_PAGE_ID:
-            skipped += 1
-            continue
-
-
-        title = clean_str(row.get("title"), page_id)
-        
-
-        layout = clean_str(row.get("layout"), "home")
-        lang_code = clean_str(row.get("lang_code"), "en")
-        parent_id = clean_str(row.get("parent_id"), "") if "parent_id" in df.columns else ""
-        has_children = as_bool(row.get("has_children", False))
-
-        # Use display_order as nav_order (your new sheet standard)
-        nav_order = as_int(row.get("display_order", 0), default=0)
-        if nav_order <= 0:
-            nav_order = 1  # deterministic fallback
-
-        frontmatter = build_frontmatter(
+            return "skipped"
+
+        title = titles[i] or page_id
+        layout = layouts[i] or "home"
+        lang_code = lang_codes[i] or "en"
+        parent_id = parent_ids[i]
+        has_children = has_children_flags[i]
+        nav_order = nav_orders[i]
+
+        # Most pages are top-level: skip the ancestor lookup for them entirely
+        if parent_id:
+            parent_title, grand_parent_title = nav_ancestors.get(parent_id, NO_ANCESTORS)
+        else:
+            parent_title, grand_parent_title = NO_ANCESTORS
+        front = render_frontmatter(
             title=title,
             layout=layout,
             nav_order=nav_order,
             has_children=has_children,
-            parent_id=parent_id,
-            title_by_page_id=title_by_page_id,
-            parent_by_page_id=parent_by_page_id,
-        )
-
-        md = safe_frontmatter_dump(frontmatter) + build_body(
-            page_id=page_id,
-            parent_id=parent_id,
-            lang_code=lang_code,
-            title=title,
+            parent_title=parent_title,
+            grand_parent_title=grand_parent_title,
         )
 
-        out_path = OUTPUT_DIR / f"{page_id}.md"
-        front = safe_frontmatter_dump(frontmatter)
+        out_name = f"{page_id}.md"
+        out_path = OUTPUT_DIR / out_name
         stub_body = build_body(page_id=page_id, parent_id=parent_id, lang_code=lang_code, title=title)
 
-        upsert_markdown_file(out_path, front, stub_body)
+        # With duplicate page_ids an earlier row may have just created the file
+        exists = (out_name in existing_files) if unique_ids else None
+        return "wrote" if upsert_markdown_file(out_path, front, stub_body, exists=exists) else "unchanged"
+
+    # Every row owns its own output file, so rows can be processed concurrently.
+    # Duplicate page_ids would race on the same file: keep those runs sequential (last row wins).
+    if unique_ids:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            counts = Counter(ex.map(process_row, range(len(df))))
+    else:
+        counts = Counter(map(process_row, range(len(df))))
 
-        wrote += 1
+    wrote = counts["wrote"]
+    unchanged = counts["unchanged"]
+    skipped = counts["skipped"]
 
     print(f"✅ Generated {wrote} pages in: {OUTPUT_DIR}")
+    print(f"= Left {unchanged} up-to-date pages untouched")
     print(f"↪ Skipped {skipped} welcome/root rows (page_id={WELCOME_PAGE_ID})")
     print(f"📄 Source spreadsheet: {EXCEL_PATH}")
 